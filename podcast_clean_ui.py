@@ -8,11 +8,17 @@ First install customtkinter:
 """
 
 import base64
+import heapq
+import itertools
+import json
 import os
 import sys
 import math
+import queue
+import subprocess
 import tempfile
 import threading
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
@@ -78,6 +84,1050 @@ def obfuscate_word(word):
         chars[idx] = "*"
     return "".join(chars)
 
+def hit_ranges(found):
+    """Merge (word, start, end) hits into censor ranges, joining gaps under 0.3s."""
+    ranges = []
+    for _, s, e in sorted(found, key=lambda hit: hit[1]):
+        if ranges and s <= ranges[-1][1] + 0.3:
+            ranges[-1] = (ranges[-1][0], max(ranges[-1][1], e))
+        else:
+            ranges.append((s, e))
+    return ranges
+
+# ── Checkpointed transcription ──────────────────────────────────────────────
+
+SAMPLE_RATE = 16000         # Whisper's input rate
+CHECKPOINT_WINDOW_S = 300   # Audio per checkpointed window (5 minutes)
+CONTEXT_CHARS = 600         # Tail of transcript carried into the next window
+
+def checkpoint_path(audio_path):
+    """Checkpoint file kept next to the audio while transcription is in progress."""
+    base, _ = os.path.splitext(audio_path)
+    return base + "-transcript.partial.json"
+
+def checkpoint_key(audio_path, model_name):
+    """Identify a source file + model pair so stale checkpoints are ignored."""
+    st = os.stat(audio_path)
+    return {"file": os.path.basename(audio_path), "size": st.st_size,
+            "mtime": int(st.st_mtime), "model": model_name}
+
+def _load_checkpoint(path, key):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get("key") != key:
+        return None
+    return state
+
+def _save_checkpoint(path, state):
+    # Write-then-rename so a crash mid-write never leaves a corrupt checkpoint.
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+def _shift_segment(seg, offset):
+    """Copy a Whisper segment into plain JSON types, moved by offset seconds."""
+    words = [{"word": w["word"],
+              "start": round(float(w["start"]) + offset, 3),
+              "end": round(float(w["end"]) + offset, 3),
+              "probability": float(w.get("probability", 0.0))}
+             for w in seg.get("words", [])]
+    return {"start": round(float(seg["start"]) + offset, 3),
+            "end": round(float(seg["end"]) + offset, 3),
+            "text": seg.get("text", ""),
+            "words": words}
+
+def _merge_ranges(ranges):
+    """Sorted [start, end] ranges with overlapping and touching ones joined."""
+    merged = []
+    for a, b in sorted(ranges):
+        if merged and a <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], b)
+        else:
+            merged.append([a, b])
+    return merged
+
+def _uncovered(spans, covered, min_gap=0.05):
+    """The parts of spans that no covered range overlaps."""
+    left = []
+    for a, b in spans:
+        for c, d in covered:
+            if d <= a or c >= b:
+                continue
+            if c - a >= min_gap:
+                left.append((a, c))
+            a = max(a, d)
+        if b - a >= min_gap:
+            left.append((a, b))
+    return left
+
+def _transcribe_checked(model, check, *args, **kwargs):
+    """model.transcribe() that runs check() before every 30 s decode it makes."""
+    if check is None:
+        return model.transcribe(*args, **kwargs)
+    decode = model.decode
+
+    def checked_decode(*a, **kw):
+        check()
+        return decode(*a, **kw)
+
+    # transcribe() looks up model.decode per seek, so an instance attribute
+    # shadows the method for this call only.
+    model.decode = checked_decode
+    try:
+        return model.transcribe(*args, **kwargs)
+    finally:
+        del model.decode
+
+def transcribe_windowed(model, samples, ckpt_path, key, on_progress=None, check=None,
+                        spans=None):
+    """
+    Transcribe 16 kHz mono samples window by window, checkpointing after each.
+
+    Every completed window's segments and language are written to
+    ckpt_path, so a run that dies part way through resumes from the last
+    completed window. Each window is prompted with the transcript tail that
+    precedes it in time. The last segment of a
+    window is dropped and re-decoded at the start of the next one, so words
+    are never split at a window boundary. check() runs before every window
+    and before each of Whisper's 30 s decodes inside it, and may raise to
+    stop early; the checkpoint is kept for the next run.
+
+    spans restricts decoding to (start, end) ranges in seconds (default: the
+    whole file). The checkpoint records the ranges already decoded rather
+    than a cursor, so a resumed run with different spans (the fingerprint
+    cache matched less this time) still decodes every part not yet covered.
+    The result carries "decoded_s", the seconds of audio this call actually
+    sent to the model.
+    """
+    total_s = len(samples) / SAMPLE_RATE
+    spans = spans if spans is not None else [(0.0, total_s)]
+    todo_s = sum(b - a for a, b in spans) or 1.0
+    state = _load_checkpoint(ckpt_path, key) or {
+        "key": key, "covered": [], "language": None, "segments": []}
+    decoded_s = 0.0
+
+    while True:
+        todo = _uncovered(spans, state["covered"])
+        if not todo:
+            break
+        if check:
+            check()
+        span = todo[0]
+        start = span[0]
+        end = min(span[1], start + CHECKPOINT_WINDOW_S)
+        chunk = samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+        # Windows can run out of time order on resume, so prompt with the
+        # text that precedes this window rather than the last one decoded.
+        before = sorted((seg for seg in state["segments"] if seg["end"] <= start),
+                        key=lambda seg: seg["start"])
+        context = "".join(seg["text"] for seg in before[-8:])[-CONTEXT_CHARS:]
+        result = _transcribe_checked(
+            model, check, chunk, word_timestamps=True, verbose=None,
+            language=state["language"],
+            initial_prompt=context or None)
+
+        segs = [_shift_segment(seg, start) for seg in result.get("segments", [])]
+        if end < span[1] and len(segs) > 1:
+            segs.pop()
+            reached = max(segs[-1]["end"], start + 1.0)
+        else:
+            reached = end
+        decoded_s += reached - start
+        state["covered"] = _merge_ranges(state["covered"] + [[start, reached]])
+
+        state["segments"].extend(segs)
+        state["language"] = state["language"] or result.get("language")
+        _save_checkpoint(ckpt_path, state)
+        if on_progress:
+            left_s = sum(b - a for a, b in _uncovered(spans, state["covered"]))
+            on_progress(min(1.0 - left_s / todo_s, 1.0))
+
+    segments = sorted(state["segments"], key=lambda seg: seg["start"])
+    for i, seg in enumerate(segments):
+        seg["id"] = i
+    return {"text": "".join(seg["text"] for seg in segments),
+            "segments": segments, "language": state["language"],
+            "decoded_s": decoded_s}
+
+# ── Fingerprint cache ───────────────────────────────────────────────────────
+
+FP_FRAME = 4096             # 256 ms analysis frame
+FP_HOP = 256                # 16 ms between hashes; heavy overlap keeps hashes
+                            # stable when audio lands off the frame grid
+FP_BANDS = 33               # Log-spaced 300–2000 Hz bands → 32 bits per hash
+FP_MAX_BUCKET = 20          # Ignore hash values this common (silence, hum)
+FP_MIN_VOTES = 40           # Exact hash hits needed before an offset is verified
+FP_MAX_CANDIDATES = 24
+FP_SMOOTH = 128             # Frames (~2 s) averaged when scoring a match
+FP_MAX_BER = 0.30           # Bit error rate below which audio counts as the same
+FP_MIN_RUN_S = 15.0         # Shortest recurring segment worth reusing
+FP_INDEX_EPISODES = 20      # Episodes kept in the index, newest first
+
+def fingerprint_dir():
+    return os.path.join(os.path.expanduser("~"), ".podcastclean", "fingerprints")
+
+def fingerprint(samples):
+    """
+    Compact spectral hashes of 16 kHz mono audio, one uint32 per 16 ms.
+
+    Each bit is the sign of the energy difference between neighbouring bands,
+    differenced again over time (Haitsma & Kalker), which survives re-encoding
+    and level changes but differs for unrelated audio.
+    """
+    import numpy as np
+
+    if len(samples) < FP_FRAME + 2 * FP_HOP:
+        return np.zeros(0, np.uint32)
+    frames = np.lib.stride_tricks.sliding_window_view(samples, FP_FRAME)[::FP_HOP]
+    window = np.hanning(FP_FRAME).astype(np.float32)
+    freqs = np.fft.rfftfreq(FP_FRAME, 1 / SAMPLE_RATE)
+    band = np.digitize(freqs, np.geomspace(300, 2000, FP_BANDS + 1)) - 1
+    bands = np.zeros((len(freqs), FP_BANDS), np.float32)
+    inside = (band >= 0) & (band < FP_BANDS)
+    bands[np.nonzero(inside)[0], band[inside]] = 1.0
+
+    energy = np.empty((len(frames), FP_BANDS), np.float32)
+    for i in range(0, len(frames), 1024):     # Chunked to bound FFT memory
+        spec = np.fft.rfft(frames[i:i + 1024] * window, axis=1)
+        energy[i:i + 1024] = (spec.real ** 2 + spec.imag ** 2).astype(np.float32) @ bands
+
+    d = np.diff(energy, axis=1)
+    bits = (d[1:] - d[:-1]) > 0
+    weights = (np.uint32(1) << np.arange(FP_BANDS - 1, dtype=np.uint32))
+    return (bits * weights).sum(axis=1, dtype=np.uint32)
+
+def _bit_errors(a, b):
+    import numpy as np
+    x = np.ascontiguousarray(a ^ b)
+    return np.unpackbits(x.view(np.uint8)).reshape(-1, 32).sum(axis=1)
+
+def _true_runs(mask):
+    """(start, end) index pairs of every run of True in a boolean array."""
+    import numpy as np
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return list(zip(np.nonzero(edges == 1)[0], np.nonzero(edges == -1)[0]))
+
+class FingerprintIndex:
+    """
+    On-disk index of fingerprinted episodes and their word-timestamped segments.
+
+    One .npz per episode under root; matching is done against every entry
+    transcribed with the same model, so cached words are never mixed with a
+    different model's output.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._entries = None
+        self._lookup = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        import numpy as np
+        if self._entries is not None:
+            return
+        self._entries = []
+        for name in sorted(self._entry_names()):
+            try:
+                with np.load(os.path.join(self.root, name)) as data:
+                    hashes = data["hashes"]
+                    meta = json.loads(str(data["meta"]))
+            except Exception:
+                continue    # Unreadable entries are simply skipped
+            self._entries.append({"id": name[:-4], "hashes": hashes, **meta})
+
+    def _entry_names(self):
+        """Entry file names under root; leftovers of an interrupted add() are deleted."""
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if name.endswith(".tmp.npz"):
+                try: os.unlink(os.path.join(self.root, name))
+                except OSError: pass
+            elif name.endswith(".npz"):
+                entries.append(name)
+        return entries
+
+    def _table(self, model):
+        """Hashes of every entry for model, sorted, with their entry and frame."""
+        import numpy as np
+        if model not in self._lookup:
+            entries = [e for e in self._entries if e["model"] == model]
+            if entries:
+                hashes = np.concatenate([e["hashes"] for e in entries])
+                owner = np.concatenate([np.full(len(e["hashes"]), n, np.int64)
+                                        for n, e in enumerate(entries)])
+                frame = np.concatenate([np.arange(len(e["hashes"]), dtype=np.int64)
+                                        for e in entries])
+                order = np.argsort(hashes, kind="stable")
+                self._lookup[model] = (entries, hashes[order], owner[order], frame[order])
+            else:
+                self._lookup[model] = None
+        return self._lookup[model]
+
+    def match(self, hashes, model):
+        """
+        Find recurring audio in hashes that the index already has words for.
+
+        Returns [{"start", "end", "segments"}] in this episode's time, sorted
+        and non-overlapping. start/end never cut through a cached word, and the
+        segments hold only the cached words inside that range, shifted.
+        """
+        import numpy as np
+        with self._lock:
+            self._load()
+            table = self._table(model)
+        if table is None or len(hashes) == 0:
+            return []
+        entries, ref, owner, frame = table
+
+        # Vote for (entry, offset) pairs using exact hash hits.
+        lo = np.searchsorted(ref, hashes, "left")
+        hi = np.searchsorted(ref, hashes, "right")
+        counts = hi - lo
+        counts[counts > FP_MAX_BUCKET] = 0
+        if counts.sum() == 0:
+            return []
+        q = np.repeat(np.arange(len(hashes)), counts)
+        pos = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts - lo, counts)
+        offsets = frame[pos] - q
+        keys = owner[pos] * (1 << 32) + (offsets + (1 << 31))
+        cand, votes = np.unique(keys, return_counts=True)
+        best = np.argsort(votes)[::-1][:FP_MAX_CANDIDATES]
+
+        runs = []
+        kernel = np.ones(FP_SMOOTH, np.float32) / FP_SMOOTH
+        for k in best:
+            if votes[k] < FP_MIN_VOTES:
+                break
+            n, off = int(cand[k] >> 32), int(cand[k] & 0xFFFFFFFF) - (1 << 31)
+            theirs = entries[n]["hashes"]
+            i0, i1 = max(0, -off), min(len(hashes), len(theirs) - off)
+            if i1 - i0 < FP_SMOOTH:
+                continue
+            ber = _bit_errors(hashes[i0:i1], theirs[i0 + off:i1 + off]) / 32.0
+            score = np.convolve(ber, kernel, mode="same")
+            for a, b in _true_runs(score < FP_MAX_BER):
+                # Smoothing blurs the edges; trim them to stay on matched audio.
+                a, b = i0 + a + FP_SMOOTH // 2, i0 + b - FP_SMOOTH // 2
+                if (b - a) * FP_HOP / SAMPLE_RATE >= FP_MIN_RUN_S:
+                    runs.append((a, b, n, off))
+
+        # Longest runs win; drop anything overlapping an accepted run.
+        accepted = []
+        for a, b, n, off in sorted(runs, key=lambda r: r[0] - r[1]):
+            if all(b <= a2 or a >= b2 for a2, b2, _, _ in accepted):
+                accepted.append((a, b, n, off))
+
+        matches = []
+        for a, b, n, off in sorted(accepted):
+            shift = off * FP_HOP / SAMPLE_RATE      # Their time = our time + shift
+            m = _reuse_words(entries[n]["segments"], a * FP_HOP / SAMPLE_RATE + shift,
+                             b * FP_HOP / SAMPLE_RATE + shift, shift)
+            if m:
+                matches.append(m)
+        return matches
+
+    def add(self, key, hashes, segments, model):
+        """Store (or replace) an episode's fingerprint and transcript."""
+        import numpy as np
+        import hashlib
+        entry_id = hashlib.sha1(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        meta = {"model": model, "name": key.get("file", ""), "segments": segments}
+        with self._lock:
+            self._load()
+            os.makedirs(self.root, exist_ok=True)
+            path = os.path.join(self.root, entry_id + ".npz")
+            tmp_path = path + ".tmp.npz"
+            np.savez(tmp_path, hashes=hashes, meta=np.array(json.dumps(meta)))
+            os.replace(tmp_path, path)
+            self._entries = [e for e in self._entries if e["id"] != entry_id]
+            self._entries.append({"id": entry_id, "hashes": hashes, **meta})
+            self._lookup.pop(model, None)
+            self._evict()
+
+    def _evict(self):
+        paths = [os.path.join(self.root, n) for n in self._entry_names()]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[FP_INDEX_EPISODES:]:
+            try: os.unlink(path)
+            except OSError: pass
+            entry_id = os.path.basename(path)[:-4]
+            self._entries = [e for e in self._entries if e["id"] != entry_id]
+            self._lookup.clear()
+
+def _reuse_words(segments, start, end, shift):
+    """Cached segments clipped to [start, end] of their episode, moved by -shift."""
+    words = [w for seg in segments for w in seg.get("words", [])]
+    # Pull the edges in so no word is split; cut-off words get re-transcribed.
+    for w in words:
+        if w["start"] < start < w["end"]:
+            start = w["end"]
+        if w["start"] < end < w["end"]:
+            end = w["start"]
+    start, end = float(start), float(end)
+    if end - start < FP_MIN_RUN_S / 2:
+        return None
+    out = []
+    for seg in segments:
+        kept = [w for w in seg.get("words", []) if w["start"] >= start and w["end"] <= end]
+        if not kept:
+            continue
+        kept = [{**w, "start": round(w["start"] - shift, 3), "end": round(w["end"] - shift, 3)}
+                for w in kept]
+        out.append({"start": kept[0]["start"], "end": kept[-1]["end"],
+                    "text": "".join(w["word"] for w in kept), "words": kept})
+    return {"start": round(start - shift, 3), "end": round(end - shift, 3), "segments": out}
+
+def novel_spans(covered, total_s, min_gap=0.3):
+    """The parts of [0, total_s] not covered by any (start, end) range."""
+    spans, pos = [], 0.0
+    for a, b in sorted(covered):
+        if a - pos >= min_gap:
+            spans.append((pos, a))
+        pos = max(pos, b)
+    if total_s - pos >= min_gap:
+        spans.append((pos, total_s))
+    return spans
+
+# ── Pipeline ────────────────────────────────────────────────────────────────
+
+PIPELINE_QUEUE_SIZE = 1     # Episodes allowed to wait between two stages
+DECODE_WORKERS = 1
+TRANSCRIBE_WORKERS = 1      # One model instance, so one transcriber
+RENDER_WORKERS = 2          # Effect + MP3 export; ffmpeg runs outside the GIL
+
+PRIORITY_URGENT = 0
+PRIORITY_NORMAL = 1
+CLOSE_TIMEOUT_S = 60        # Longest wait for workers to stop when the window closes
+
+class Cancelled(Exception):
+    """Raised inside a stage once its job has been cancelled."""
+
+class Preempted(Exception):
+    """Raised inside a stage when a higher-priority job needs the worker."""
+
+class Job:
+    """One queued episode and the data handed from stage to stage."""
+
+    def __init__(self, path, out_path, priority=PRIORITY_NORMAL):
+        self.path = path
+        self.out_path = out_path
+        self.priority = priority
+        self.report_path = None
+        self.audio = None       # Decoded AudioSegment (decode → render)
+        self.samples = None     # 16 kHz mono float32 for Whisper (decode → transcribe)
+        self.hashes = None      # Audio fingerprint (decode → transcribe)
+        self.result = None      # Whisper result (transcribe → render)
+        self.reused = []        # (start, end) ranges taken from the fingerprint cache
+        self.peaks = None       # Waveform peak pyramid for the review timeline
+        self.skipped = 0        # Hits switched off during review
+        self.saved_s = None     # Estimated transcription time the cache saved
+        self.found = []
+        self.duration = 0.0
+        self.progress = 0.0
+        self.error = None
+        self.cancelled = threading.Event()
+        self.outranked = None   # Set by the pipeline while the job may be preempted
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+    def check(self):
+        """Raise Cancelled or Preempted; stages call this between units of work."""
+        if self.cancelled.is_set():
+            raise Cancelled()
+        if self.outranked and self.outranked(self):
+            raise Preempted()
+
+    def release(self):
+        """Drop decoded buffers so a stopped job holds no audio in memory."""
+        self.audio = self.samples = self.hashes = None
+
+def run_ffmpeg(args, check=None):
+    """Run ffmpeg to completion, killing it as soon as check() raises."""
+    flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+    proc = subprocess.Popen(
+        ["ffmpeg", "-nostdin", "-y", "-hide_banner", "-loglevel", "error", *args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, creationflags=flags)
+    while True:
+        try:
+            _, err = proc.communicate(timeout=0.25)
+            break
+        except subprocess.TimeoutExpired:
+            if check is None:
+                continue
+            try:
+                check()
+            except BaseException:
+                proc.kill()
+                proc.communicate()
+                raise
+    if proc.returncode != 0:
+        lines = err.decode("utf-8", errors="replace").strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"ffmpeg exited with code {proc.returncode}")
+
+class Pipeline:
+    """
+    Push jobs through a chain of stages, each with its own pool of workers.
+
+    Stages are joined by bounded queues, so a slow stage blocks the one in
+    front of it instead of letting decoded episodes pile up in memory. While
+    episode N transcribes, N+1 can decode and N-1 can encode.
+
+    Jobs can be submitted while the pipeline runs. A job with a better
+    (lower) priority preempts lower-priority jobs that have not yet passed
+    the preempt_through stage: they stop at their next check(), release
+    their buffers and wait until the urgent job is past that stage.
+    """
+
+    def __init__(self, stages, queue_size=PIPELINE_QUEUE_SIZE,
+                 preempt_through=None, on_error=None, on_preempt=None):
+        self.stages = stages    # [(name, func, workers), ...]
+        self.queues = [queue.PriorityQueue(maxsize=queue_size) for _ in stages]
+        self.busy = {name: 0.0 for name, _, _ in stages}
+        self.wall = 0.0
+        self.on_error = on_error
+        self.on_preempt = on_preempt
+        names = [name for name, _, _ in stages]
+        self._preempt_stage = names.index(preempt_through) if preempt_through else -1
+        self._pending = []      # Heap of (priority, seq, job) not yet fed in
+        self._active = set()        # Submitted and not yet finished
+        self._contending = set()    # Active and not yet past preempt_through
+        self._closed = False
+        self._cancelled = False
+        self._seq = itertools.count()
+        self._alive = [workers for _, _, workers in stages]
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+
+    def submit(self, job):
+        """Queue a job; returns False once the pipeline is cancelled or finished."""
+        with self._cond:
+            if self._closed or self._cancelled:
+                return False
+            job.seq = next(self._seq)
+            self._active.add(job)
+            self._contending.add(job)
+            heapq.heappush(self._pending, (job.priority, job.seq, job))
+            self._cond.notify_all()
+        return True
+
+    def run(self, jobs):
+        """Process every job, block until the last stage drains, return utilization."""
+        for job in jobs:
+            self.submit(job)
+        threads = []
+        for i, (name, _, workers) in enumerate(self.stages):
+            for n in range(workers):
+                t = threading.Thread(target=self._worker, args=(i,),
+                                     name=f"{name}-{n}", daemon=True)
+                t.start()
+                threads.append(t)
+        t0 = time.perf_counter()
+        self._feed()
+        for t in threads:
+            t.join()
+        self.wall = time.perf_counter() - t0
+        return self.utilization()
+
+    def _feed(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._active:
+                        self._closed = True
+                        break
+                    # Hold back jobs that would only be preempted again.
+                    if self._pending and not self._outranked(self._pending[0][2]):
+                        break
+                    self._cond.wait()
+                if self._closed:
+                    break
+                item = heapq.heappop(self._pending)
+            self.queues[0].put(item)    # Blocks while the first stage is full
+        for _ in range(self.stages[0][2]):
+            self.queues[0].put((math.inf, next(self._seq), None))
+
+    def _outranked(self, job):
+        # Caller holds self._lock.
+        return any(other.priority < job.priority for other in self._contending)
+
+    def _check_outranked(self, job):
+        # Job.check() runs on worker threads while submit/_finish change the set.
+        with self._lock:
+            return self._outranked(job)
+
+    def _worker(self, i):
+        name, func, _ = self.stages[i]
+        inbox = self.queues[i]
+        outbox = self.queues[i + 1] if i + 1 < len(self.stages) else None
+        while True:
+            _, _, job = inbox.get()
+            if job is None:
+                break
+            job.outranked = self._check_outranked if i <= self._preempt_stage else None
+            t0 = time.perf_counter()
+            try:
+                job.check()
+                func(job)
+            except Preempted:
+                job.release()
+                if self.on_preempt:
+                    self.on_preempt(job, name)
+                with self._cond:
+                    heapq.heappush(self._pending, (job.priority, job.seq, job))
+                    self._cond.notify_all()
+                continue
+            except Exception as e:
+                job.error = e
+                job.release()
+                if self.on_error:
+                    self.on_error(job, name, e)
+                self._finish(job)
+                continue
+            finally:
+                job.outranked = None
+                with self._lock:
+                    self.busy[name] += time.perf_counter() - t0
+            if i == self._preempt_stage:
+                with self._cond:
+                    self._contending.discard(job)
+                    self._cond.notify_all()
+            if outbox is not None:
+                outbox.put((job.priority, job.seq, job))    # Blocks while the next stage is full
+            else:
+                self._finish(job)
+        # The last worker out tells every worker of the next stage to stop.
+        with self._lock:
+            self._alive[i] -= 1
+            last = self._alive[i] == 0
+        if last and outbox is not None:
+            for _ in range(self.stages[i + 1][2]):
+                outbox.put((math.inf, next(self._seq), None))
+
+    def _finish(self, job):
+        with self._cond:
+            self._active.discard(job)
+            self._contending.discard(job)
+            self._cond.notify_all()
+
+    def cancel(self):
+        """Cancel every job, queued or running, and refuse new ones."""
+        with self._cond:
+            self._cancelled = True
+            jobs = list(self._active)
+        for job in jobs:
+            job.cancelled.set()
+
+    def utilization(self):
+        """Fraction of the run each stage's worker pool spent busy."""
+        wall = max(self.wall, 1e-9)
+        return {name: self.busy[name] / (wall * workers)
+                for name, _, workers in self.stages}
+
+# ── Batched transcription ───────────────────────────────────────────────────
+
+BATCH_WINDOW_S = 30.0       # Whisper's fixed input length
+BATCH_CUT_SEARCH_S = 4.0    # Look this far back from a window edge for a quiet cut
+BATCH_MAX = 16
+BATCH_MEMORY_SHARE = 0.5    # Fraction of free memory a batch may plan to use
+BATCHED_TRANSCRIBE_WORKERS = 3  # Episodes feeding windows to the engine at once
+TEMPERATURES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+def plan_windows(samples, spans):
+    """
+    Split (start, end) spans into independent windows of at most 30 s.
+
+    Each cut is placed at the quietest 20 ms in the last few seconds before
+    the 30 s limit, so windows rarely split a word.
+    """
+    import numpy as np
+    frame = SAMPLE_RATE // 50
+    windows = []
+    for a, b in spans:
+        t = a
+        while b - t > 0.2:
+            end = t + BATCH_WINDOW_S
+            if end >= b:
+                windows.append((t, b))
+                break
+            lo = int((end - BATCH_CUT_SEARCH_S) * SAMPLE_RATE)
+            n = (int(end * SAMPLE_RATE) - lo) // frame
+            energy = (samples[lo:lo + n * frame].reshape(n, frame) ** 2).mean(axis=1)
+            cut = (lo + (int(np.argmin(energy)) + 0.5) * frame) / SAMPLE_RATE
+            windows.append((t, cut))
+            t = cut
+    return windows
+
+def _free_memory(device):
+    """Bytes currently free on the device the model runs on."""
+    import torch
+    if device.type == "cuda":
+        return torch.cuda.mem_get_info(device)[0]
+    try:
+        import psutil
+        return psutil.virtual_memory().available
+    except ImportError:
+        pass
+    if sys.platform == "win32":
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+        stat = MEMORYSTATUSEX()
+        stat.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):
+            return stat.ullAvailPhys
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return 2 << 30
+
+def _window_bytes(model, fp16):
+    """Rough peak memory one 30 s window adds to a batch."""
+    d = model.dims
+    scale = 2 if fp16 else 4
+    # Encoder self-attention scores, heads × ctx × ctx; one layer's are live at a time.
+    attention = d.n_audio_ctx ** 2 * d.n_audio_head * scale
+    activations = d.n_audio_ctx * d.n_audio_state * 16 * scale       # Encoder hidden states + MLP
+    cross_cache = d.n_audio_ctx * d.n_text_state * 2 * d.n_text_layer * scale   # Decoder's cached K/V
+    return attention + activations + cross_cache + d.n_mels * 3000 * 4
+
+def _is_oom(e):
+    import torch
+    oom = getattr(torch.cuda, "OutOfMemoryError", ())
+    return isinstance(e, (MemoryError, oom)) or "out of memory" in str(e).lower()
+
+class _WindowRequest:
+    """One episode's windows waiting on, or being run by, the batched engine."""
+
+    def __init__(self, samples, windows, language, priority, seq):
+        self.samples = samples
+        self.windows = windows
+        self.language = language
+        self.priority = priority
+        self.seq = seq
+        self.finished = queue.Queue()   # (index, segments), or None after an error
+        self.partial = {}               # index → segments of a window still being decoded
+        self.error = None
+        self.withdrawn = False
+
+class BatchedTranscriber:
+    """
+    Shared Whisper engine that batches 30 s windows from many episodes.
+
+    Transcription workers hand their episode's windows to transcribe(); a
+    single engine thread stacks pending log-mel windows from every caller
+    into one batch for the encoder and decoder, then routes each window's
+    segments back to its caller. All model calls stay on that thread,
+    because Whisper installs hooks on the shared model while decoding.
+    The batch size follows free memory and is capped lower after an
+    out-of-memory error.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.fp16 = model.device.type != "cpu"
+        self.batches = 0
+        self.windows = 0
+        self.compute_s = 0.0    # Engine time spent on batches ...
+        self.audio_s = 0.0      # ... and the audio they covered
+        self._ceiling = BATCH_MAX
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._settled = []      # Items of the current batch already handed on
+        self._thread = threading.Thread(target=self._loop, name="whisper-batch", daemon=True)
+        self._thread.start()
+
+    def batch_size(self):
+        per_window = _window_bytes(self.model, self.fp16)
+        fits = int(_free_memory(self.model.device) * BATCH_MEMORY_SHARE // per_window)
+        return max(1, min(self._ceiling, fits))
+
+    def transcribe(self, samples, windows, language=None, priority=PRIORITY_NORMAL,
+                   on_window=None, check=None):
+        """
+        Transcribe windows of samples; block until every one is done.
+
+        on_window(index, segments, language) is called on the caller's thread
+        as each window completes; segments are in file time. check() runs
+        while waiting and may raise to withdraw the remaining windows.
+        """
+        req = _WindowRequest(samples, list(windows), language, priority, next(self._seq))
+        with self._cond:
+            for i in range(len(windows)):
+                heapq.heappush(self._heap, (priority, req.seq, i, req))
+            self._cond.notify_all()
+        remaining = len(windows)
+        try:
+            while remaining:
+                if check:
+                    check()
+                try:
+                    item = req.finished.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                if item is None:
+                    raise req.error
+                remaining -= 1
+                if on_window:
+                    on_window(item[0], item[1], req.language)
+        except BaseException:
+            req.withdrawn = True    # The engine drops its queued windows
+            raise
+
+    def close(self):
+        """Stop the engine; the batch in progress ends after its current decode pass."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        # Wait for it, so the engine thread holds no reference to the model
+        # once the caller releases it.
+        self._thread.join()
+        self.model = None
+
+    def _wanted(self, item):
+        return not item[3].withdrawn and not self._closed
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._heap and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                items = self._take(self.batch_size())
+            if not any(self._wanted(item) for item in items):
+                continue
+            self._settled = []
+            try:
+                items = self._detect_languages(items)
+                self._run(items)
+            except Exception as e:
+                if _is_oom(e) and len(items) > 1:
+                    self._ceiling = max(1, len(items) // 2)
+                    self._empty_cache()
+                    with self._cond:
+                        for item in items:
+                            # Windows already reported or re-queued stay as they are.
+                            if not any(item is done for done in self._settled):
+                                heapq.heappush(self._heap, item)
+                    continue
+                for req in {item[3] for item in items}:
+                    req.error = e
+                    req.finished.put(None)
+
+    def _take(self, size):
+        """Pop the most urgent windows that share a language (or need detecting)."""
+        items, aside = [], []
+        while self._heap and len(items) < size:
+            item = heapq.heappop(self._heap)
+            req = item[3]
+            if req.withdrawn:
+                continue
+            if items and req.language != items[0][3].language:
+                aside.append(item)
+            else:
+                items.append(item)
+        for item in aside:
+            heapq.heappush(self._heap, item)
+        return items
+
+    def _mel(self, req, i):
+        import whisper
+        a, b = req.windows[i]
+        chunk = req.samples[int(a * SAMPLE_RATE):int(b * SAMPLE_RATE)]
+        return whisper.log_mel_spectrogram(whisper.pad_or_trim(chunk), self.model.dims.n_mels)
+
+    def _detect_languages(self, items):
+        """Detect each new episode's language from its first window; keep one language."""
+        import torch
+        if not self.model.is_multilingual:
+            for item in items:
+                item[3].language = "en"
+            return items
+        unknown = list({item[3] for item in items if item[3].language is None})
+        if not unknown:
+            return items
+        mel = torch.stack([self._mel(req, 0) for req in unknown]).to(self.model.device)
+        _, probs = self.model.detect_language(mel.half() if self.fp16 else mel)
+        for req, p in zip(unknown, probs):
+            req.language = max(p, key=p.get)
+        language = items[0][3].language
+        with self._cond:
+            for item in items:
+                if item[3].language != language:
+                    heapq.heappush(self._heap, item)
+        return [item for item in items if item[3].language == language]
+
+    def _run(self, items):
+        import torch
+        from whisper.decoding import DecodingOptions, decode
+        from whisper.timing import add_word_timestamps
+        from whisper.tokenizer import get_tokenizer
+
+        items = [item for item in items if self._wanted(item)]
+        if not items:
+            return
+        model = self.model
+        language = items[0][3].language
+        t0 = time.perf_counter()
+        audio_s = sum(b - a for a, b in (req.windows[i] for _, _, i, req in items))
+        mel = torch.stack([self._mel(req, i) for _, _, i, req in items]).to(model.device)
+        if self.fp16:
+            mel = mel.half()
+
+        # Decode the whole batch, then retry only the windows that need a
+        # higher temperature, as model.transcribe does per window.
+        results = [None] * len(items)
+        todo = list(range(len(items)))
+        for t in TEMPERATURES:
+            # Cancelled or preempted callers have withdrawn; stop decoding for them.
+            todo = [k for k in todo if self._wanted(items[k])]
+            if not todo:
+                break
+            options = DecodingOptions(language=language, temperature=t, fp16=self.fp16)
+            retry = []
+            for k, r in zip(todo, decode(model, mel[todo], options)):
+                results[k] = r
+                silent = r.no_speech_prob > 0.6 and r.avg_logprob < -1.0
+                if not silent and (r.compression_ratio > 2.4 or r.avg_logprob < -1.0):
+                    retry.append(k)
+            todo = retry
+            if not todo:
+                break
+        self.batches += 1
+        self.windows += len(items)
+
+        tokenizer = get_tokenizer(model.is_multilingual, num_languages=model.num_languages,
+                                  language=language, task="transcribe")
+        for item, r, m in zip(items, results, mel):
+            _, _, i, req = item
+            if r is None or not self._wanted(item):
+                continue
+            a, b = req.windows[i]
+            segments, resume_at = [], None
+            if not (r.no_speech_prob > 0.6 and r.avg_logprob < -1.0):
+                segments, resume_at = _token_segments(r.tokens, tokenizer, b - a)
+                add_word_timestamps(segments=segments, model=model, tokenizer=tokenizer,
+                                    mel=m, num_frames=round((b - a) * SAMPLE_RATE / 160),
+                                    last_speech_timestamp=0.0)
+            done = req.partial.pop(i, []) + [_shift_segment(seg, a) for seg in segments]
+            if resume_at and b - (a + resume_at) > 0.2:
+                # Decode the rest of the window again from the last timestamp
+                # before reporting it, as model.transcribe would seek there.
+                req.partial[i] = done
+                req.windows[i] = (a + resume_at, b)
+                with self._cond:
+                    heapq.heappush(self._heap, item)
+                    self._cond.notify_all()
+            else:
+                req.finished.put((i, done))
+            self._settled.append(item)
+        self.compute_s += time.perf_counter() - t0
+        self.audio_s += audio_s
+
+    def _empty_cache(self):
+        import gc
+        import torch
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+def _token_segments(tokens, tokenizer, duration):
+    """
+    Split decoded tokens into segments at Whisper's timestamp tokens.
+
+    Returns (segments, resume_at). As in model.transcribe, output that has
+    paired timestamps but does not end on a single one stops at the last
+    pair: text after it is dropped and resume_at is that pair's time, from
+    which the rest of the window must be decoded again. resume_at is None
+    when the whole window was consumed.
+    """
+    is_ts = [tok >= tokenizer.timestamp_begin for tok in tokens]
+    pairs = [k + 1 for k in range(len(tokens) - 1) if is_ts[k] and is_ts[k + 1]]
+    single_ending = is_ts[-2:] == [False, True]
+    resume_at = None
+    if pairs and not single_ending:
+        last = pairs[-1]
+        resume_at = (tokens[last - 1] - tokenizer.timestamp_begin) * 0.02
+        tokens = tokens[:last]
+
+    segments, start, text = [], 0.0, []
+
+    def close(end):
+        if tokenizer.decode(text).strip():
+            segments.append({"seek": 0, "start": start, "end": min(end, duration),
+                             "text": tokenizer.decode(text), "tokens": list(text)})
+
+    for tok in tokens:
+        if tok >= tokenizer.timestamp_begin:
+            t = (tok - tokenizer.timestamp_begin) * 0.02
+            if text:
+                close(t)
+                text = []
+            start = t
+        elif tok < tokenizer.eot:
+            text.append(tok)
+    if text:
+        close(duration)
+    return segments, resume_at
+
+def transcribe_batched(engine, samples, ckpt_path, key, on_progress=None, check=None,
+                       spans=None, priority=PRIORITY_NORMAL):
+    """
+    transcribe_windowed's counterpart for the batched engine.
+
+    Windows are independent, so the checkpoint records each finished window
+    by its start time and a resumed run only submits the missing ones.
+    Returns the same result shape, including "decoded_s".
+    """
+    total_s = len(samples) / SAMPLE_RATE
+    spans = spans if spans is not None else [(0.0, total_s)]
+    windows = plan_windows(samples, spans)
+    state = _load_checkpoint(ckpt_path, key) or {"key": key, "language": None, "done": {}}
+    names = [f"{a:.3f}" for a, _ in windows]
+    todo = [i for i, name in enumerate(names) if name not in state["done"]]
+    todo_s = sum(b - a for a, b in windows) or 1.0
+    decoded = [0.0]
+
+    def on_window(k, segments, language):
+        a, b = windows[todo[k]]
+        state["done"][names[todo[k]]] = segments
+        state["language"] = language
+        decoded[0] += b - a
+        _save_checkpoint(ckpt_path, state)
+        if on_progress:
+            done_s = sum(b - a for (a, b), name in zip(windows, names) if name in state["done"])
+            on_progress(min(done_s / todo_s, 1.0))
+
+    if todo:
+        engine.transcribe(samples, [windows[i] for i in todo], state["language"], priority,
+                          on_window, check)
+
+    segments = [seg for name in names for seg in state["done"][name]]
+    for i, seg in enumerate(segments):
+        seg["id"] = i
+    return {"text": "".join(seg["text"] for seg in segments),
+            "segments": segments, "language": state["language"],
+            "decoded_s": decoded[0]}
+
 # ── Colors ──────────────────────────────────────────────────────────────────
 
 DARK_BG    = "#e4e4e4"
@@ -174,6 +1224,301 @@ def _mode_icon(kind, color, size=24):
 
     return ctk.CTkImage(light_image=img, dark_image=img, size=(size, size))
 
+# ── Hit review timeline ─────────────────────────────────────────────────────
+
+PEAK_BIN = 256              # Samples (16 ms) per bin at the finest pyramid level
+REVIEW_PAD_S = 2.0          # Audio played either side of a hit
+NUDGE_S = 0.05              # Step for moving a hit's start or end
+
+def peaks_path(audio_path):
+    base, _ = os.path.splitext(audio_path)
+    return base + "-peaks.npz"
+
+def build_peaks(samples):
+    """
+    Min/max peak pyramid of mono float samples.
+
+    Level 0 holds one (min, max) int16 pair per PEAK_BIN samples; each further
+    level halves the resolution, so any zoom can be drawn from a level with
+    roughly one bin per pixel without touching the raw PCM.
+    """
+    import numpy as np
+    n = len(samples) // PEAK_BIN * PEAK_BIN
+    rows = samples[:n].reshape(-1, PEAK_BIN)
+    lvl = np.stack([rows.min(axis=1), rows.max(axis=1)], axis=1)
+    if n < len(samples):
+        tail = samples[n:]
+        lvl = np.concatenate([lvl, [[tail.min(), tail.max()]]])
+    lvl = (np.clip(lvl, -1.0, 1.0) * 32767).astype(np.int16)
+    levels = [lvl]
+    while len(lvl) > 1:
+        if len(lvl) % 2:
+            lvl = np.concatenate([lvl, lvl[-1:]])
+        pairs = lvl.reshape(-1, 2, 2)
+        lvl = np.stack([pairs[:, :, 0].min(axis=1), pairs[:, :, 1].max(axis=1)], axis=1)
+        levels.append(lvl)
+    return levels
+
+def _peaks_key(audio_path):
+    st = os.stat(audio_path)
+    return {"size": st.st_size, "mtime": int(st.st_mtime), "bin": PEAK_BIN}
+
+def load_peaks(audio_path):
+    """Cached pyramid for audio_path, or None if missing or out of date."""
+    import numpy as np
+    try:
+        with np.load(peaks_path(audio_path)) as data:
+            if json.loads(str(data["key"])) != _peaks_key(audio_path):
+                return None
+            return [data[f"level{i}"] for i in range(int(data["count"]))]
+    except Exception:
+        return None
+
+def save_peaks(audio_path, levels):
+    import numpy as np
+    path = peaks_path(audio_path)
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, key=np.array(json.dumps(_peaks_key(audio_path))),
+             count=len(levels), **{f"level{i}": lvl for i, lvl in enumerate(levels)})
+    os.replace(tmp_path, path)
+
+def peak_columns(levels, t0, t1, width):
+    """Per-pixel (mins, maxs) in -1..1 for seconds [t0, t1] across width pixels."""
+    import numpy as np
+    spp = (t1 - t0) / width
+    k = 0
+    while k + 1 < len(levels) and PEAK_BIN * 2 ** (k + 1) / SAMPLE_RATE <= spp:
+        k += 1
+    lvl = levels[k]
+    bin_s = PEAK_BIN * 2 ** k / SAMPLE_RATE
+    times = t0 + np.arange(width) * spp
+    idx = np.minimum(times / bin_s, len(lvl) - 1).astype(np.int64)
+    stop = int(min(len(lvl), max(idx[-1] + 1, math.ceil(t1 / bin_s))))
+    mins = np.minimum.reduceat(lvl[:stop, 0], idx) / 32767.0
+    maxs = np.maximum.reduceat(lvl[:stop, 1], idx) / 32767.0
+    past_end = times >= len(levels[0]) * PEAK_BIN / SAMPLE_RATE
+    mins[past_end] = maxs[past_end] = 0.0
+    return mins, maxs
+
+def play_clip(audio, start_s, end_s):
+    """Play part of an AudioSegment on a background thread."""
+    clip = audio[int(max(0.0, start_s) * 1000):int(end_s * 1000)]
+
+    def _play():
+        try:
+            if sys.platform == "win32":
+                import io
+                import winsound
+                buf = io.BytesIO()
+                clip.export(buf, format="wav")
+                winsound.PlaySound(buf.getvalue(), winsound.SND_MEMORY)
+            else:
+                from pydub.playback import play
+                play(clip)
+        except Exception:
+            pass    # No audio device / player; reviewing still works silently
+
+    threading.Thread(target=_play, daemon=True).start()
+
+class ReviewWindow(ctk.CTkToplevel):
+    """Waveform timeline for toggling, nudging and auditioning hits before export."""
+
+    def __init__(self, master, job, hits, on_done):
+        super().__init__(master)
+        self.job, self.hits, self.on_done = job, hits, on_done
+        self.duration = max(job.duration, 0.1)
+        self.view = (0.0, self.duration)    # Visible range in seconds
+        self._drag = None
+        self.title(f"Review hits — {job.name}")
+        self.configure(fg_color=DARK_BG)
+        self.geometry("900x600")
+        self.minsize(640, 420)
+        self.protocol("WM_DELETE_WINDOW", self._finish)
+        self._build()
+        self.after(50, self._redraw)
+        self.after(200, self._watch_cancel)
+        self.lift()
+        self.focus_force()
+
+    def _build(self):
+        ctk.CTkLabel(self, text=f"{len(self.hits)} hit(s) in {self.job.name}",
+                     font=ctk.CTkFont("Helvetica", 16, "bold"),
+                     text_color=TEXT, anchor="w").pack(fill="x", padx=20, pady=(16, 0))
+        ctk.CTkLabel(self, text="Scroll to zoom · drag to pan · click a highlighted hit to toggle it",
+                     font=ctk.CTkFont("Helvetica", 12),
+                     text_color=MUTED, anchor="w").pack(fill="x", padx=20)
+
+        self.canvas = tk.Canvas(self, height=170, bg=CARD_BG, highlightthickness=0)
+        self.canvas.pack(fill="x", padx=20, pady=(10, 0))
+        self.canvas.bind("<Configure>", self._redraw)
+        self.canvas.bind("<MouseWheel>", lambda e: self._zoom(e.x, e.delta > 0))
+        self.canvas.bind("<Button-4>", lambda e: self._zoom(e.x, True))
+        self.canvas.bind("<Button-5>", lambda e: self._zoom(e.x, False))
+        self.canvas.bind("<ButtonPress-1>", self._press)
+        self.canvas.bind("<B1-Motion>", self._pan)
+        self.canvas.bind("<ButtonRelease-1>", self._release)
+
+        rows = ctk.CTkScrollableFrame(self, fg_color=CARD_BG, corner_radius=10)
+        rows.pack(fill="both", expand=True, padx=20, pady=(10, 0))
+        rows.grid_columnconfigure(1, weight=1)
+        self.row_vars, self.row_labels = [], []
+        for i, hit in enumerate(self.hits):
+            var = ctk.BooleanVar(value=hit["on"])
+            ctk.CTkCheckBox(rows, text="", width=24, variable=var,
+                            fg_color=ACCENT, hover_color=ACCENT_H, border_color=BORDER,
+                            command=lambda i=i: self._toggle(i, from_row=True)
+                            ).grid(row=i, column=0, padx=(8, 4), pady=2)
+            lbl = ctk.CTkLabel(rows, text="", font=ctk.CTkFont("Courier", 12),
+                               text_color=TEXT, anchor="w", cursor="hand2")
+            lbl.grid(row=i, column=1, sticky="ew")
+            lbl.bind("<Button-1>", lambda e, i=i: self._focus(i))
+            for col, (text, edge, step) in enumerate([("Start −", "start", -NUDGE_S),
+                                                      ("Start +", "start", NUDGE_S),
+                                                      ("End −", "end", -NUDGE_S),
+                                                      ("End +", "end", NUDGE_S)], start=2):
+                ctk.CTkButton(rows, text=text, width=58, height=26,
+                              font=ctk.CTkFont("Helvetica", 11),
+                              fg_color=CARD2_BG, hover_color=CARD2_H, text_color=TEXT,
+                              corner_radius=6,
+                              command=lambda i=i, edge=edge, step=step: self._nudge(i, edge, step)
+                              ).grid(row=i, column=col, padx=2, pady=2)
+            ctk.CTkButton(rows, text="▶", width=34, height=26,
+                          fg_color=ACCENT, hover_color=ACCENT_H, text_color=WHITE,
+                          corner_radius=6, command=lambda i=i: self._play(i)
+                          ).grid(row=i, column=6, padx=(2, 8), pady=2)
+            self.row_vars.append(var)
+            self.row_labels.append(lbl)
+            self._update_row(i)
+
+        ctk.CTkButton(self, text="🔇   EXPORT", font=ctk.CTkFont("Helvetica", 15, "bold"),
+                      fg_color=ACCENT, hover_color=ACCENT_H, text_color=WHITE,
+                      corner_radius=10, height=48, command=self._finish
+                      ).pack(fill="x", padx=20, pady=16)
+
+    # ── Timeline ────────────────────────────────────────────────────────────
+
+    def _x(self, t):
+        t0, t1 = self.view
+        return (t - t0) / (t1 - t0) * self.canvas.winfo_width()
+
+    def _t(self, x):
+        t0, t1 = self.view
+        return t0 + x / max(self.canvas.winfo_width(), 1) * (t1 - t0)
+
+    def _set_view(self, t0, span):
+        span = min(max(span, 1.0), self.duration)
+        t0 = min(max(t0, 0.0), self.duration - span)
+        self.view = (t0, t0 + span)
+        self._redraw()
+
+    def _redraw(self, _event=None):
+        c = self.canvas
+        c.delete("all")
+        w, h = c.winfo_width(), c.winfo_height()
+        if w < 2 or h < 2:
+            return
+        t0, t1 = self.view
+
+        for hit in self.hits:
+            if hit["end"] < t0 or hit["start"] > t1:
+                continue
+            x0, x1 = self._x(hit["start"]), self._x(hit["end"])
+            c.create_rectangle(x0, 0, max(x1, x0 + 2), h, outline=ERROR if hit["on"] else BORDER,
+                               fill="#f6caca" if hit["on"] else CARD2_BG, dash=() if hit["on"] else (3, 3))
+
+        if self.job.peaks:
+            mins, maxs = peak_columns(self.job.peaks, t0, t1, w)
+            mid = h / 2
+            for x in range(w):
+                c.create_line(x, mid - maxs[x] * mid, x, mid - mins[x] * mid + 1, fill=ACCENT)
+
+        # Time ticks at least ~90 px apart
+        step = next((s for s in (0.1, 0.5, 1, 5, 10, 30, 60, 300, 600, 1800, 3600)
+                     if s / (t1 - t0) * w >= 90), 3600)
+        t = math.ceil(t0 / step) * step
+        while t <= t1:
+            x = self._x(t)
+            c.create_line(x, h - 6, x, h, fill=MUTED)
+            label = f"{int(t//60)}:{t%60:04.1f}" if step < 1 else f"{int(t//60)}:{int(t%60):02d}"
+            c.create_text(x + 3, h - 8, text=label, anchor="sw", fill=MUTED, font=("Helvetica", 9))
+            t += step
+
+    def _zoom(self, x, zoom_in):
+        t0, t1 = self.view
+        pivot = self._t(x)
+        span = (t1 - t0) * (0.8 if zoom_in else 1.25)
+        self._set_view(pivot - (pivot - t0) * span / (t1 - t0), span)
+
+    def _press(self, event):
+        self._drag = (event.x, self.view[0], False)
+
+    def _pan(self, event):
+        if self._drag is None:
+            return
+        x0, view0, _ = self._drag
+        if abs(event.x - x0) > 3:
+            self._drag = (x0, view0, True)
+            t0, t1 = self.view
+            self._set_view(view0 - (event.x - x0) / self.canvas.winfo_width() * (t1 - t0), t1 - t0)
+
+    def _release(self, event):
+        dragged = self._drag and self._drag[2]
+        self._drag = None
+        if dragged:
+            return
+        t = self._t(event.x)
+        for i, hit in enumerate(self.hits):
+            if hit["start"] <= t <= hit["end"]:
+                self._toggle(i)
+                break
+
+    # ── Hits ────────────────────────────────────────────────────────────────
+
+    def _update_row(self, i):
+        hit = self.hits[i]
+        mm, ss = int(hit["start"] // 60), hit["start"] % 60
+        self.row_labels[i].configure(
+            text=f'[{mm:02d}:{ss:05.2f}  {hit["end"] - hit["start"]:.2f}s]  "{obfuscate_word(hit["word"])}"',
+            text_color=TEXT if hit["on"] else MUTED)
+
+    def _toggle(self, i, from_row=False):
+        hit = self.hits[i]
+        hit["on"] = self.row_vars[i].get() if from_row else not hit["on"]
+        self.row_vars[i].set(hit["on"])
+        self._update_row(i)
+        self._redraw()
+
+    def _nudge(self, i, edge, step):
+        hit = self.hits[i]
+        value = min(max(hit[edge] + step, 0.0), self.duration)
+        if edge == "start":
+            hit["start"] = min(value, hit["end"] - NUDGE_S)
+        else:
+            hit["end"] = max(value, hit["start"] + NUDGE_S)
+        self._update_row(i)
+        self._redraw()
+
+    def _focus(self, i):
+        hit = self.hits[i]
+        span = max(10.0, (hit["end"] - hit["start"]) * 4)
+        self._set_view((hit["start"] + hit["end"]) / 2 - span / 2, span)
+
+    def _play(self, i):
+        hit = self.hits[i]
+        self._focus(i)
+        if self.job.audio is not None:
+            play_clip(self.job.audio, hit["start"] - REVIEW_PAD_S, hit["end"] + REVIEW_PAD_S)
+
+    def _watch_cancel(self):
+        if self.job.cancelled.is_set():
+            self.destroy()
+        else:
+            self.after(200, self._watch_cancel)
+
+    def _finish(self):
+        self.destroy()
+        self.on_done()
+
 # ── App ─────────────────────────────────────────────────────────────────────
 
 class App(ctk.CTk):
@@ -194,13 +1539,17 @@ class App(ctk.CTk):
         self.geometry(f"{w}x{h}+{x}+{y}")
         self.minsize(580, 780)
 
-        self.audio_path = None
+        self.audio_paths = []
         self.mode_var   = tk.StringVar(value="bleep")
         self.model_var  = tk.StringVar(value="base")
         self.processing = False
         self.custom_words = []
+        self._pipeline = None
+        self._fp_index = FingerprintIndex(fingerprint_dir())
+        self._speed = {}    # Model name → seconds of compute per second of audio
 
         self._build()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         threading.Thread(target=self._check_deps, daemon=True).start()
 
     # ── Build UI ────────────────────────────────────────────────────────────
@@ -336,6 +1685,26 @@ class App(ctk.CTk):
             variable=self.religious_var)
         self.religious_switch.pack(anchor="w")
 
+        self.review_var = ctk.BooleanVar(value=False)
+        self.review_switch = ctk.CTkSwitch(
+            rel_frame, text="Review hits before export",
+            font=ctk.CTkFont("Helvetica", 13),
+            text_color=TEXT, fg_color=CARD2_BG,
+            progress_color=ACCENT, button_color=ACCENT,
+            button_hover_color=ACCENT_H,
+            variable=self.review_var)
+        self.review_switch.pack(anchor="w", pady=(8, 0))
+
+        self.batch_var = ctk.BooleanVar(value=False)
+        self.batch_switch = ctk.CTkSwitch(
+            rel_frame, text="Batch transcription across episodes (faster queues)",
+            font=ctk.CTkFont("Helvetica", 13),
+            text_color=TEXT, fg_color=CARD2_BG,
+            progress_color=ACCENT, button_color=ACCENT,
+            button_hover_color=ACCENT_H,
+            variable=self.batch_var)
+        self.batch_switch.pack(anchor="w", pady=(8, 0))
+
         # — Custom words —
         self._section(opts, "EXTRA WORDS TO BLEEP", row=5, top=18)
         wr = ctk.CTkFrame(opts, fg_color="transparent")
@@ -462,31 +1831,42 @@ class App(ctk.CTk):
 
     def _on_drop(self, event):
         self.drop_card.configure(border_color=BORDER)
-        path = event.data.strip().strip('{}')  # Windows wraps paths in {}
-        if os.path.isfile(path):
-            self._set_file(path)
+        # splitlist handles the {} Windows wraps around paths with spaces
+        paths = [p for p in self.tk.splitlist(event.data) if os.path.isfile(p)]
+        if paths and self.processing:
+            self._enqueue(paths)
+        elif paths:
+            self._set_files(paths)
 
     def _choose_file(self):
-        path = filedialog.askopenfilename(
-            title="Choose podcast",
+        paths = filedialog.askopenfilenames(
+            title="Choose podcast(s)",
             filetypes=[("Audio", "*.mp3 *.m4a *.wav *.ogg *.flac *.aac"), ("All", "*.*")])
-        if path:
-            self._set_file(path)
-
-    def _set_file(self, path):
-        self.audio_path = path
-        name = os.path.basename(path)
-        size = os.path.getsize(path) / 1024 / 1024
+        if paths and self.processing:
+            self._enqueue(list(paths))
+        elif paths:
+            self._set_files(list(paths))
+
+    def _set_files(self, paths):
+        self.audio_paths = paths
+        size = sum(os.path.getsize(p) for p in paths) / 1024 / 1024
         self.drop_emoji.configure(text="✅")
-        self.drop_title.configure(text=name, text_color=TEXT)
         self.drop_hint.configure(text=f"{size:.1f} MB · ready to process")
         self.drop_card.configure(border_color=GREEN)
         self.process_btn.configure(state="normal")
-        # Pre-fill output filename based on input
-        base, _ = os.path.splitext(name)
         self.filename_entry.delete(0, "end")
-        self.filename_entry.insert(0, base + "-clean.mp3")
-        self._log(f"Loaded: {name}")
+        if len(paths) == 1:
+            name = os.path.basename(paths[0])
+            self.drop_title.configure(text=name, text_color=TEXT)
+            # Pre-fill output filename based on input
+            base, _ = os.path.splitext(name)
+            self.filename_entry.insert(0, base + "-clean.mp3")
+            self._log(f"Loaded: {name}")
+        else:
+            self.drop_title.configure(text=f"{len(paths)} episodes queued", text_color=TEXT)
+            for p in paths:
+                self._log(f"Queued: {os.path.basename(p)}")
+            self._log("  Each episode saves as <name>-clean.mp3")
 
     def _add_word(self):
         w = self.word_entry.get().strip().lower()
@@ -512,65 +1892,282 @@ class App(ctk.CTk):
     # ── Processing ──────────────────────────────────────────────────────────
 
     def _start(self):
-        if self.processing or not self.audio_path: return
+        if self.processing:
+            self._cancel()
+            return
+        if not self.audio_paths: return
         self.processing = True
+        # Snapshot settings here: Tk variables must only be read on the UI thread.
+        word_list = CURSE_WORDS + (RELIGIOUS_WORDS if self.religious_var.get() else [])
+        self._settings = {
+            "mode": self.mode_var.get(),
+            "model": self.model_var.get(),
+            "bad": set(word_list + self.custom_words),
+            "review": self.review_var.get(),
+            "batched": self.batch_var.get(),
+        }
+        jobs = [Job(p, self._output_path(p)) for p in self.audio_paths]
+        # Set up before the worker starts, so files dropped straight away can be queued.
+        self._jobs = jobs
+        self._model = None
+        self._engine = None
+        self._model_lock = threading.Lock()
+        # Batching lets several episodes feed windows to one shared engine.
+        transcribers = BATCHED_TRANSCRIBE_WORKERS if self._settings["batched"] else TRANSCRIBE_WORKERS
+        self._pipeline = Pipeline([
+            ("decode", self._decode, DECODE_WORKERS),
+            ("transcribe", self._transcribe, transcribers),
+            ("render", self._render, RENDER_WORKERS),
+        ], preempt_through="transcribe",
+           on_error=self._job_failed, on_preempt=self._job_preempted)
         self.pbar.configure(progress_color=ACCENT)
-        self.process_btn.configure(state="disabled", text="⏳  Processing...")
-        threading.Thread(target=self._run, daemon=True).start()
+        self.pbar.set(0)
+        self.process_btn.configure(text="⏹   CANCEL")
+        threading.Thread(target=self._run, args=(self._pipeline, jobs), daemon=True).start()
+
+    def _cancel(self):
+        pipeline = self._pipeline
+        if pipeline is None: return
+        self.process_btn.configure(state="disabled", text="⏳  Cancelling...")
+        self._status("Cancelling — stopping at the next safe point...")
+        self._log("⏹ Cancelling...")
+        pipeline.cancel()
+
+    def _enqueue(self, paths):
+        """Add files to the running queue, optionally ahead of everything else."""
+        names = ", ".join(os.path.basename(p) for p in paths)
+        urgent = messagebox.askyesno(
+            "Add to queue",
+            f"{names}\n\nProcess now? The episode currently transcribing will "
+            "pause and resume afterwards.\n\nChoose No to add it to the end of the queue.")
+        priority = PRIORITY_URGENT if urgent else PRIORITY_NORMAL
+        for p in paths:
+            base_path, _ = os.path.splitext(p)
+            job = Job(p, base_path + "-clean.mp3", priority)
+            self._jobs.append(job)
+            if self._pipeline is None or not self._pipeline.submit(job):
+                self._jobs.remove(job)
+                self._log(f"Not queued (run is stopping): {job.name}")
+                continue
+            self._log(f"{'Next up' if urgent else 'Queued'}: {job.name}")
+
+    def _on_close(self):
+        if not self.processing:
+            self.destroy()
+            return
+        # Give workers time to kill ffmpeg, delete their temp files and finish
+        # the Whisper decode they are in (one 30 s seek; slow on CPU).
+        self._cancel()
+        self._close_deadline = time.monotonic() + CLOSE_TIMEOUT_S
+        self._close_when_idle()
+
+    def _close_when_idle(self):
+        if not self.processing or time.monotonic() > self._close_deadline:
+            self.destroy()
+        else:
+            self.after(100, self._close_when_idle)
+
+    def _output_path(self, path):
+        base_path, _ = os.path.splitext(path)
+        custom_name = self.filename_entry.get().strip()
+        if custom_name and len(self.audio_paths) == 1:
+            if not custom_name.lower().endswith(".mp3"):
+                custom_name += ".mp3"
+            return os.path.join(os.path.dirname(path), custom_name)
+        return base_path + "-clean.mp3"
 
-    def _run(self):
+    def _run(self, pipeline, jobs):
         try:
-            self._process()
+            util = pipeline.run(jobs)
+            jobs = self._jobs   # May have grown while running
+            cancelled = any(isinstance(j.error, Cancelled) for j in jobs)
+            if cancelled:
+                self.after(0, self._status, "⏹ Cancelled")
+                self.after(0, self._log, "⏹ Cancelled — partial transcripts are kept and will resume")
+            if len(jobs) > 1:
+                busy = "  ·  ".join(f"{name} {u:.0%}" for name, u in util.items())
+                self.after(0, self._log, f"▶ Stage utilization: {busy}")
+                self.after(0, self._log, f"  Total time {int(pipeline.wall//60)}m {int(pipeline.wall%60)}s")
+                reused_s = sum(b - a for j in jobs for a, b in j.reused)
+                total_s = sum(j.duration for j in jobs)
+                if reused_s:
+                    saved_s = sum(j.saved_s or 0 for j in jobs)
+                    self.after(0, self._log, f"  ♻ Cache reused {reused_s / total_s:.0%} of the audio, "
+                                             f"saving ~{int(saved_s//60)}m {int(saved_s%60)}s")
+            engine = self._engine
+            if engine is not None and engine.batches:
+                self.after(0, self._log, f"  Batched inference: {engine.windows} window(s) in "
+                                         f"{engine.batches} batch(es), {engine.windows / engine.batches:.1f} per batch")
+            done = [j for j in jobs if j.error is None]
+            if done and not cancelled:
+                words = sum(len(j.found) for j in done)
+                self.after(0, self._progress, 1.0)
+                self.after(0, self._status, f"✅ Done! {words} word(s) censored", GREEN)
+                self.after(500, lambda: self._done(jobs))
         except Exception as e:
             self.after(0, self._log, f"❌ Error: {e}")
             self.after(0, self._status, f"❌ {e}", ERROR)
         finally:
+            self._pipeline = None
+            if self._engine is not None:
+                self._engine.close()
+                self._engine = None
+            self._release_model()
             self.processing = False
             self.after(0, self.process_btn.configure,
                        {"state": "normal", "text": "🔇   PROCESS & SAVE"})
 
-    def _process(self):
+    def _release_model(self):
+        self._model = None
+        import gc
+        gc.collect()
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def _job_failed(self, job, stage, e):
+        if isinstance(e, Cancelled):
+            self._job_log(job, f"⏹ Cancelled during {stage}")
+            return
+        self.after(0, self._log, f"❌ {job.name}: {stage} failed — {e}")
+        self.after(0, self._status, f"❌ {e}", ERROR)
+
+    def _job_preempted(self, job, stage):
+        job.progress = 0.0
+        self._job_log(job, f"⏸ Paused during {stage} for a higher-priority episode")
+
+    def _job_log(self, job, msg):
+        prefix = f"[{job.name}] " if len(self._jobs) > 1 else ""
+        self.after(0, self._log, prefix + msg)
+
+    def _job_progress(self, job, v):
+        job.progress = v
+        total = sum(j.progress for j in self._jobs) / len(self._jobs)
+        self.after(0, self._progress, min(total, 0.99))
+
+    def _decode(self, job):
         import numpy as np
         from pydub import AudioSegment
+
+        self.after(0, self._status, f"Loading {job.name}...")
+        self._job_log(job, "▶ Loading audio...")
+
+        # One ffmpeg pass writes the full-quality WAV used for rendering and
+        # the 16 kHz mono PCM Whisper reads. Cancelling kills it straight away.
+        fd, wav_path = tempfile.mkstemp(suffix=".wav"); os.close(fd)
+        fd, pcm_path = tempfile.mkstemp(suffix=".pcm"); os.close(fd)
+        try:
+            run_ffmpeg(["-i", job.path,
+                        "-vn", "-acodec", "pcm_s16le", "-f", "wav", wav_path,
+                        "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", pcm_path],
+                       job.check)
+            audio = AudioSegment.from_wav(wav_path)
+            job.check()
+            samples = np.fromfile(pcm_path, np.int16).astype(np.float32) / 32768.0
+            job.check()
+            job.hashes = fingerprint(samples)
+            if self._settings["review"]:
+                job.peaks = load_peaks(job.path)
+                if job.peaks is None:
+                    job.peaks = build_peaks(samples)
+                    try: save_peaks(job.path, job.peaks)
+                    except OSError: pass
+        finally:
+            for path in (wav_path, pcm_path):
+                try: os.unlink(path)
+                except: pass
+
+        job.duration = dur = len(audio) / 1000
+        self._job_log(job, f"  {int(dur//60)}m {int(dur%60)}s · {audio.channels}ch · {audio.frame_rate}Hz")
+        job.audio, job.samples = audio, samples
+        self._job_progress(job, 0.15)
+
+    def _transcribe(self, job):
         import whisper
 
-        self.after(0, self._status, "Loading audio...")
-        self.after(0, self._progress, 0.05)
-        self.after(0, self._log, f"▶ Loading audio...")
-
-        audio = AudioSegment.from_file(self.audio_path)
-        dur = len(audio) / 1000
-        self.after(0, self._log, f"  {int(dur//60)}m {int(dur%60)}s · {audio.channels}ch · {audio.frame_rate}Hz")
-
-        # Write temp WAV for Whisper
-        tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False, mode="wb")
-        audio.set_channels(1).set_frame_rate(16000).export(tmp.name, format="wav")
-        tmp.close()
-
-        # Load Whisper model
-        self.after(0, self._status, f"Loading Whisper model '{self.model_var.get()}'...")
-        self.after(0, self._progress, 0.15)
-        self.after(0, self._log, f"▶ Loading Whisper '{self.model_var.get()}' model...")
-        model = whisper.load_model(self.model_var.get())
-
-        # Transcribe
-        self.after(0, self._status, "Transcribing audio... ☕ grab a coffee")
-        self.after(0, self._progress, 0.25)
-        self.after(0, self._log, "▶ Transcribing (this takes a while)...")
-
-        result = model.transcribe(tmp.name, word_timestamps=True, verbose=False)
-        self._last_result = result
-        try: os.unlink(tmp.name)
+        model_name = self._settings["model"]
+        batched = self._settings["batched"]
+        with self._model_lock:
+            if self._model is None:
+                self.after(0, self._status, f"Loading Whisper model '{model_name}'...")
+                self.after(0, self._log, f"▶ Loading Whisper '{model_name}' model...")
+                self._model = whisper.load_model(model_name)
+            if batched and self._engine is None:
+                self._engine = BatchedTranscriber(self._model)
+
+        self.after(0, self._status, f"Transcribing {job.name}... ☕ grab a coffee")
+        self._job_log(job, "▶ Transcribing (this takes a while)...")
+
+        ckpt = checkpoint_path(job.path)
+        key = checkpoint_key(job.path, model_name)
+        ckpt_key = {**key, "engine": "batched"} if batched else key
+        resumed = _load_checkpoint(ckpt, ckpt_key)
+        if resumed and resumed.get("covered"):
+            at = sum(b - a for a, b in resumed["covered"])
+            self._job_log(job, f"  Resuming — {int(at//60)}m {int(at%60)}s already transcribed")
+        elif resumed and resumed.get("done"):
+            self._job_log(job, f"  Resuming — {len(resumed['done'])} window(s) already done")
+
+        # Recurring intros, outros and ad reads reuse cached words; only the
+        # rest of the episode goes to the model.
+        total_s = len(job.samples) / SAMPLE_RATE
+        matches = self._fp_index.match(job.hashes, model_name)
+        job.reused = [(m["start"], m["end"]) for m in matches]
+        if matches:
+            reused_s = sum(b - a for a, b in job.reused)
+            self._job_log(job, f"  ♻ {len(matches)} recurring segment(s) recognized — "
+                               f"{int(reused_s//60)}m {int(reused_s%60)}s reused from cache")
+
+        def on_progress(frac):
+            self._job_progress(job, 0.15 + 0.50 * frac)
+
+        spans = novel_spans(job.reused, total_s)
+        t0 = time.perf_counter()
+        if batched:
+            result = transcribe_batched(self._engine, job.samples, ckpt, ckpt_key, on_progress,
+                                        check=job.check, spans=spans, priority=job.priority)
+        else:
+            result = transcribe_windowed(self._model, job.samples, ckpt, key, on_progress,
+                                         check=job.check, spans=spans)
+        elapsed = time.perf_counter() - t0
+        job.samples = None
+
+        # A checkpoint from an earlier run may overlap what the cache now covers.
+        segments = [seg for seg in result["segments"]
+                    if not any(a <= (seg["start"] + seg["end"]) / 2 <= b for a, b in job.reused)]
+        segments += [seg for m in matches for seg in m["segments"]]
+        segments.sort(key=lambda seg: seg["start"])
+        for i, seg in enumerate(segments):
+            seg["id"] = i
+        job.result = {"text": "".join(seg["text"] for seg in segments),
+                      "segments": segments, "language": result["language"]}
+
+        if batched:
+            # elapsed includes waiting behind other episodes; use engine time.
+            if self._engine.audio_s >= 30:
+                self._speed[model_name] = self._engine.compute_s / self._engine.audio_s
+        elif result["decoded_s"] >= 30:
+            self._speed[model_name] = elapsed / result["decoded_s"]
+        if job.reused and model_name in self._speed:
+            job.saved_s = sum(b - a for a, b in job.reused) * self._speed[model_name]
+
+        try:
+            self._fp_index.add(key, job.hashes, segments, model_name)
+        except OSError as e:
+            self._job_log(job, f"  Fingerprint cache not updated: {e}")
+        job.hashes = None
+        try: os.unlink(ckpt)
         except: pass
 
-        self.after(0, self._progress, 0.65)
-        self.after(0, self._log, f"  ✓ Done — {len(result['segments'])} segments")
+        self._job_log(job, f"  ✓ Done — {len(segments)} segments")
+
+    def _render(self, job):
+        import numpy as np
 
         # Find curse words - comprehensive detection
-        self.after(0, self._status, "Scanning for curse words...")
-        word_list = CURSE_WORDS + (RELIGIOUS_WORDS if self.religious_var.get() else [])
-        bad = set(word_list + self.custom_words)
-        ranges, found = [], []
+        self.after(0, self._status, f"Scanning {job.name} for curse words...")
+        bad = self._settings["bad"]
+        found = []
 
         def is_bad(word_str):
             clean = "".join(c for c in word_str.lower() if c.isalpha())
@@ -582,37 +2179,39 @@ class App(ctk.CTk):
                     return True
             return False
 
-        for seg in result.get("segments", []):
+        for seg in job.result.get("segments", []):
             for wi in seg.get("words", []):
                 if is_bad(wi.get("word", "")):
                     # Extra padding to make sure full word is covered
                     s = max(0, wi["start"] - 0.1)
                     e = wi["end"] + 0.1
                     found.append((wi["word"].strip(), s, e))
-                    # Merge ranges within 0.3s of each other
-                    if ranges and s <= ranges[-1][1] + 0.3:
-                        ranges[-1] = (ranges[-1][0], max(ranges[-1][1], e))
-                    else:
-                        ranges.append((s, e))
 
-        self.after(0, self._log, f"▶ {len(found)} word(s) found")
+        self._job_log(job, f"▶ {len(found)} word(s) found")
         for word, s, e in found:
-            self.after(0, self._log, f"  [{s:.1f}s – {e:.1f}s]  \"{obfuscate_word(word)}\"")
+            self._job_log(job, f"  [{s:.1f}s – {e:.1f}s]  \"{obfuscate_word(word)}\"")
+
+        if self._settings["review"] and found:
+            found = self._review(job, found)
+            self._job_log(job, f"  Reviewed — {len(found)} kept, {job.skipped} left uncensored")
+        job.found = found
+        ranges = hit_ranges(found)
 
         # Apply effect
-        mode = self.mode_var.get()
-        self.after(0, self._status, f"Applying {mode} effect...")
-        self.after(0, self._progress, 0.80)
+        mode = self._settings["mode"]
+        audio = job.audio
+        self.after(0, self._status, f"Applying {mode} effect to {job.name}...")
+        self._job_progress(job, 0.75)
 
         sr, ch = audio.frame_rate, audio.channels
 
         if mode == "cut":
             # Build list of kept segments and concatenate
-            self.after(0, self._log, f"▶ Cutting out {len(ranges)} segment(s)...")
-            from pydub import AudioSegment as AS
+            self._job_log(job, f"▶ Cutting out {len(ranges)} segment(s)...")
             kept = []
             prev_end_ms = 0
             for s0s, e0s in sorted(ranges):
+                job.check()
                 s0_ms = int(s0s * 1000)
                 e0_ms = int(e0s * 1000)
                 if prev_end_ms < s0_ms:
@@ -627,12 +2226,13 @@ class App(ctk.CTk):
             orig_dur = len(audio) / 1000
             new_dur = len(out_audio) / 1000
             saved = orig_dur - new_dur
-            self.after(0, self._log, f"  ✓ Cut {saved:.1f}s of audio — {int(new_dur//60)}m {int(new_dur%60)}s remaining")
+            self._job_log(job, f"  ✓ Cut {saved:.1f}s of audio — {int(new_dur//60)}m {int(new_dur%60)}s remaining")
         else:
             samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
             if ch == 2: samples = samples.reshape((-1, 2))
 
             for s0s, e0s in ranges:
+                job.check()
                 s0 = int(s0s * sr)
                 s1 = min(len(samples), int(e0s * sr))
                 d  = s1 - s0
@@ -651,7 +2251,6 @@ class App(ctk.CTk):
                         idx = s0 + i
                         if idx >= len(samples): break
                         t = i / sr
-                        t = i / sr
                         # Raised-cosine envelope — completely smooth, no clicks
                         env = 0.5 * (1 - math.cos(2 * math.pi * t / ds)) if ds > 0 else 0
                         b = math.sin(2 * math.pi * 440 * t) * 0.15 * env * 32767
@@ -660,52 +2259,76 @@ class App(ctk.CTk):
             import array as arr
             raw = arr.array("h", np.clip(samples, -32768, 32767).astype(np.int16).flatten().tolist())
             out_audio = audio._spawn(raw.tobytes())
+            del samples, raw
 
         # Save
-        self.after(0, self._status, "Saving...")
-        self.after(0, self._progress, 0.93)
+        self.after(0, self._status, f"Saving {os.path.basename(job.out_path)}...")
+        self._job_progress(job, 0.90)
 
-        custom_name = self.filename_entry.get().strip()
-        base_path, _ = os.path.splitext(self.audio_path)
-        if custom_name:
-            if not custom_name.lower().endswith(".mp3"):
-                custom_name += ".mp3"
-            out_path = os.path.join(os.path.dirname(self.audio_path), custom_name)
-        else:
-            out_path = base_path + "-clean.mp3"
         # Match original file bitrate
         try:
             from mutagen.mp3 import MP3
-            orig_bitrate = int(MP3(self.audio_path).info.bitrate / 1000)
+            orig_bitrate = int(MP3(job.path).info.bitrate / 1000)
             orig_bitrate = max(64, min(320, orig_bitrate))  # clamp to sane range
             bitrate = f"{orig_bitrate}k"
         except Exception:
             bitrate = "128k"  # safe fallback
-        out_audio.export(out_path, format="mp3", bitrate=bitrate)
-        self.after(0, self._log, f"  Exported at {bitrate}")
+        # Encode to a .part file first so a cancelled export never leaves a
+        # truncated MP3 behind under the real name.
+        fd, wav_path = tempfile.mkstemp(suffix=".wav"); os.close(fd)
+        part_path = job.out_path + ".part"
+        try:
+            out_audio.export(wav_path, format="wav")
+            job.audio = out_audio = None
+            run_ffmpeg(["-i", wav_path, "-f", "mp3", "-b:a", bitrate, part_path], job.check)
+            os.replace(part_path, job.out_path)
+        finally:
+            for path in (wav_path, part_path):
+                try: os.unlink(path)
+                except: pass
+        self._job_log(job, f"  Exported at {bitrate}")
 
         # Generate report
-        base_path, _ = os.path.splitext(self.audio_path)
-        report_path = base_path + "-report.txt"
-        self._write_report(report_path, found, ranges, mode, dur, out_path)
-
-        self.after(0, self._progress, 1.0)
-        self.after(0, self._status, f"✅ Done! {len(found)} word(s) censored", GREEN)
-        self.after(0, self._log, f"✅ Saved: {out_path}")
-        self.after(0, self._log, f"📄 Report: {report_path}")
-        self.after(500, lambda: self._done(out_path, report_path, len(found), mode))
-
-    def _write_report(self, report_path, found, ranges, mode, orig_dur, out_path):
+        base_path, _ = os.path.splitext(job.path)
+        job.report_path = base_path + "-report.txt"
+        self._write_report(job, mode)
+
+        self._job_progress(job, 1.0)
+        self._job_log(job, f"✅ Saved: {job.out_path}")
+        self._job_log(job, f"📄 Report: {job.report_path}")
+
+    def _review(self, job, found):
+        """Hold this render worker until the user closes the review timeline."""
+        hits = [{"word": w, "start": s, "end": e, "on": True} for w, s, e in found]
+        done = threading.Event()
+        self.after(0, self._status, f"Review the hits in {job.name}, then press EXPORT")
+        self.after(0, lambda: ReviewWindow(self, job, hits, done.set))
+        while not done.wait(0.2):
+            job.check()
+        job.peaks = None
+        job.skipped = sum(not hit["on"] for hit in hits)
+        return [(hit["word"], hit["start"], hit["end"]) for hit in hits if hit["on"]]
+
+    def _write_report(self, job, mode):
+        found, orig_dur = job.found, job.duration
         mode_label = {"bleep": "Bleep Sound", "mute": "Mute / Silence", "cut": "Cut Out"}[mode]
         lines = []
         lines.append("=" * 60)
         lines.append("  PODCASTCLEAN — CENSOR REPORT")
         lines.append("=" * 60)
-        lines.append(f"  Input file : {os.path.basename(self.audio_path)}")
-        lines.append(f"  Output file: {os.path.basename(out_path)}")
+        lines.append(f"  Input file : {os.path.basename(job.path)}")
+        lines.append(f"  Output file: {os.path.basename(job.out_path)}")
         lines.append(f"  Mode       : {mode_label}")
         lines.append(f"  Duration   : {int(orig_dur//60)}m {int(orig_dur%60)}s")
         lines.append(f"  Words found: {len(found)}")
+        if job.skipped:
+            lines.append(f"  Reviewed   : {job.skipped} hit(s) left uncensored")
+        reused_s = sum(b - a for a, b in job.reused)
+        hit = reused_s / orig_dur if orig_dur else 0
+        lines.append(f"  Cache hits : {len(job.reused)} recurring segment(s), "
+                     f"{int(reused_s//60)}m {int(reused_s%60)}s ({hit:.0%} of episode)")
+        if job.saved_s is not None:
+            lines.append(f"  Time saved : ~{int(job.saved_s//60)}m {int(job.saved_s%60)}s of transcription")
         lines.append("=" * 60)
         lines.append("")
 
@@ -730,12 +2353,9 @@ class App(ctk.CTk):
 
             # Write full transcript with censored words marked
             try:
-                import whisper
-                # Re-use already loaded result stored on self if available
-                result = getattr(self, '_last_result', None)
+                result = job.result
                 if result:
-                    word_list = CURSE_WORDS + (RELIGIOUS_WORDS if self.religious_var.get() else [])
-                    bad = set(word_list + self.custom_words)
+                    bad = self._settings["bad"]
                     for seg in result.get("segments", []):
                         ts = seg.get("start", 0)
                         mm = int(ts // 60)
@@ -754,12 +2374,24 @@ class App(ctk.CTk):
             except Exception:
                 pass
 
-        with open(report_path, "w", encoding="utf-8") as f:
+        with open(job.report_path, "w", encoding="utf-8") as f:
             f.write("\n".join(lines))
 
-    def _done(self, out_path, report_path, count, mode):
-        extra = "\nSwear-free and shorter! ✂️" if mode == "cut" else ""
-        if messagebox.askyesno("✅ Done!", f"Clean file saved!\n\n{os.path.basename(out_path)}\n\n{count} word(s) censored.{extra}\n\nA report was saved next to the audio file.\n\nOpen folder?"):
+    def _done(self, jobs):
+        done = [j for j in jobs if j.error is None]
+        out_path = done[-1].out_path
+        extra = "\nSwear-free and shorter! ✂️" if self._settings["mode"] == "cut" else ""
+        if len(jobs) == 1:
+            count = len(done[0].found)
+            msg = f"Clean file saved!\n\n{os.path.basename(out_path)}\n\n{count} word(s) censored.{extra}\n\nA report was saved next to the audio file."
+        else:
+            count = sum(len(j.found) for j in done)
+            failed = len(jobs) - len(done)
+            msg = f"{len(done)} of {len(jobs)} episodes cleaned!\n\n{count} word(s) censored in total.{extra}"
+            if failed:
+                msg += f"\n\n{failed} episode(s) failed — see the log."
+            msg += "\n\nReports were saved next to each audio file."
+        if messagebox.askyesno("✅ Done!", msg + "\n\nOpen folder?"):
             import subprocess
             subprocess.Popen(["explorer", "/select,", os.path.normpath(out_path)])
 
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("PIL")
+
+from podcast_clean_ui import (SAMPLE_RATE, _load_checkpoint, _uncovered, novel_spans,
+                              transcribe_windowed)
+
+
+class FakeModel:
+    """Emits a 10 s segment per 10 s of audio; can crash after a number of calls."""
+
+    def __init__(self, fail_after=None):
+        self.calls = []
+        self.prompts = []
+        self.fail_after = fail_after
+
+    def decode(self, *args, **kwargs):
+        pass
+
+    def transcribe(self, chunk, initial_prompt=None, **kwargs):
+        if self.fail_after is not None and len(self.calls) >= self.fail_after:
+            raise RuntimeError("crash")
+        self.calls.append(len(chunk) / SAMPLE_RATE)
+        self.prompts.append(initial_prompt)
+        duration = len(chunk) / SAMPLE_RATE
+        return {"language": "en", "segments": [
+            {"start": t, "end": min(t + 10.0, duration), "text": f" s{len(self.calls)}"}
+            for t in np.arange(0.0, duration, 10.0)]}
+
+
+def silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), np.float32)
+
+
+def assert_contiguous(segments, start, end):
+    assert segments[0]["start"] == pytest.approx(start)
+    assert segments[-1]["end"] == pytest.approx(end)
+    for prev, seg in zip(segments, segments[1:]):
+        assert seg["start"] == pytest.approx(prev["end"])
+
+
+def test_novel_spans_fills_gaps_between_covered_ranges():
+    assert novel_spans([(10.0, 20.0), (15.0, 30.0)], 60.0) == [(0.0, 10.0), (30.0, 60.0)]
+    assert novel_spans([(0.0, 59.9)], 60.0) == []
+    assert novel_spans([], 5.0) == [(0.0, 5.0)]
+
+
+def test_uncovered_subtracts_decoded_ranges_from_spans():
+    spans = [(0.0, 100.0), (200.0, 300.0)]
+    assert _uncovered(spans, [[50.0, 250.0]]) == [(0.0, 50.0), (250.0, 300.0)]
+    assert _uncovered(spans, [[0.0, 100.0], [200.0, 300.0]]) == []
+    assert _uncovered(spans, [[0.0, 99.99]]) == [(200.0, 300.0)]
+
+
+def test_transcribes_every_span_in_windows(tmp_path):
+    ckpt = str(tmp_path / "ep-transcript.partial.json")
+    model = FakeModel()
+    result = transcribe_windowed(model, silence(700), ckpt, {"k": 1},
+                                 spans=[(0.0, 100.0), (400.0, 700.0)])
+    assert [s["start"] for s in result["segments"]][:3] == [0.0, 10.0, 20.0]
+    assert all(not 100.0 <= s["start"] < 400.0 for s in result["segments"])
+    assert result["decoded_s"] == pytest.approx(400.0)
+    assert result["language"] == "en"
+
+
+def test_resume_with_wider_spans_decodes_what_the_first_run_skipped(tmp_path):
+    ckpt = str(tmp_path / "ep-transcript.partial.json")
+    key = {"file": "ep.mp3", "model": "base"}
+    samples = silence(1000)
+
+    with pytest.raises(RuntimeError):
+        transcribe_windowed(FakeModel(fail_after=1), samples, ckpt, key, spans=[(60.0, 1000.0)])
+    assert _load_checkpoint(ckpt, key)["covered"] == [[60.0, 350.0]]
+
+    # The cache no longer covers the intro, so [0, 60) must be decoded too.
+    model = FakeModel()
+    result = transcribe_windowed(model, samples, ckpt, key, spans=[(0.0, 1000.0)])
+    assert_contiguous(result["segments"], 0.0, 1000.0)
+    assert model.calls[0] == pytest.approx(60.0)
+    assert result["decoded_s"] == pytest.approx(710.0)
+
+
+def test_resumed_window_is_prompted_with_the_text_before_it(tmp_path):
+    ckpt = str(tmp_path / "ep-transcript.partial.json")
+    samples = silence(700)
+    with pytest.raises(RuntimeError):
+        transcribe_windowed(FakeModel(fail_after=1), samples, ckpt, {}, spans=[(60.0, 700.0)])
+
+    model = FakeModel()
+    transcribe_windowed(model, samples, ckpt, {}, spans=[(0.0, 700.0)])
+    # [0, 60) comes first and nothing precedes it; later windows follow on from earlier text.
+    assert model.prompts[0] is None
+    assert model.prompts[1]
+
+
+def test_stale_checkpoint_is_ignored(tmp_path):
+    ckpt = str(tmp_path / "ep-transcript.partial.json")
+    samples = silence(400)
+    with pytest.raises(RuntimeError):
+        transcribe_windowed(FakeModel(fail_after=1), samples, ckpt, {"model": "base"})
+
+    model = FakeModel()
+    result = transcribe_windowed(model, samples, ckpt, {"model": "small"})
+    assert model.calls[0] == pytest.approx(300.0)
+    assert result["decoded_s"] == pytest.approx(400.0)
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("PIL")
+
+from podcast_clean_ui import SAMPLE_RATE, FingerprintIndex, fingerprint
+
+RNG = np.random.default_rng(0)
+
+
+def noise(seconds):
+    return (RNG.standard_normal(int(seconds * SAMPLE_RATE)) * 0.1).astype(np.float32)
+
+
+def one_word_per_second(total_s):
+    words = [{"word": f" w{t}", "start": float(t), "end": t + 0.8, "probability": 1.0}
+             for t in range(int(total_s))]
+    return [{"start": float(t), "end": t + 9.8, "text": "", "words": words[t:t + 10]}
+            for t in range(0, int(total_s), 10)]
+
+
+INTRO = noise(30)
+EPISODE_A = np.concatenate([INTRO, noise(60)])
+
+
+def test_finds_shared_intro_at_an_offset(tmp_path):
+    index = FingerprintIndex(str(tmp_path))
+    index.add({"file": "a.mp3"}, fingerprint(EPISODE_A), one_word_per_second(90), "base")
+
+    episode_b = np.concatenate([noise(7.3), INTRO, noise(40)])
+    matches = index.match(fingerprint(episode_b), "base")
+
+    assert len(matches) == 1
+    m = matches[0]
+    assert 7.3 <= m["start"] < 12.0
+    assert 33.0 < m["end"] <= 37.3
+    words = [w for seg in m["segments"] for w in seg["words"]]
+    # Episode A's word at t seconds now sits at t + 7.3.
+    assert words[0]["word"] == " w2"
+    assert words[0]["start"] == pytest.approx(9.3, abs=0.02)    # Offsets snap to the 16 ms hop
+    assert all(m["start"] <= w["start"] and w["end"] <= m["end"] for w in words)
+
+
+def test_unrelated_audio_and_other_models_do_not_match(tmp_path):
+    index = FingerprintIndex(str(tmp_path))
+    index.add({"file": "a.mp3"}, fingerprint(EPISODE_A), one_word_per_second(90), "base")
+    assert index.match(fingerprint(noise(60)), "base") == []
+    assert index.match(fingerprint(EPISODE_A), "small") == []
+
+
+def test_half_written_entries_are_ignored_and_removed(tmp_path):
+    index = FingerprintIndex(str(tmp_path))
+    index.add({"file": "a.mp3"}, fingerprint(EPISODE_A), one_word_per_second(90), "base")
+    (entry,) = os.listdir(tmp_path)
+    leftover = tmp_path / (entry + ".tmp.npz")
+    leftover.write_bytes((tmp_path / entry).read_bytes())
+
+    reopened = FingerprintIndex(str(tmp_path))
+    assert len(reopened.match(fingerprint(EPISODE_A), "base")) == 1
+    assert [e["id"] for e in reopened._entries] == [entry[:-4]]
+    assert not leftover.exists()
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("PIL")
+
+from podcast_clean_ui import PEAK_BIN, SAMPLE_RATE, build_peaks, peak_columns
+
+LSB = 1 / 32767     # Peaks are stored as int16
+
+
+def samples(seconds, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 0.2).clip(-1, 1).astype(np.float32)
+
+
+def test_each_level_halves_the_previous_one():
+    levels = build_peaks(samples(8.1))
+    assert len(levels[0]) == -(-int(8.1 * SAMPLE_RATE) // PEAK_BIN)
+    assert len(levels[-1]) == 1
+    for fine, coarse in zip(levels, levels[1:]):
+        assert len(coarse) == -(-len(fine) // 2)
+
+
+def test_columns_match_raw_min_max_when_aligned_to_bins():
+    x = samples(8)
+    levels = build_peaks(x)
+    # 125 columns over 8 s: 1024 samples, i.e. four finest bins, per column.
+    mins, maxs = peak_columns(levels, 0.0, 8.0, 125)
+    cols = x.reshape(125, -1)
+    np.testing.assert_allclose(mins, cols.min(axis=1), atol=2 * LSB)
+    np.testing.assert_allclose(maxs, cols.max(axis=1), atol=2 * LSB)
+
+
+def test_zoomed_view_bounds_the_raw_samples():
+    x = samples(20, seed=1)
+    levels = build_peaks(x)
+    t0, t1, width = 3.37, 11.9, 97
+    mins, maxs = peak_columns(levels, t0, t1, width)
+    raw = x[int(t0 * SAMPLE_RATE):int(t1 * SAMPLE_RATE)]
+    # Columns snap outward to whole bins, so they may reach a little further than raw.
+    assert mins.min() <= raw.min() + 2 * LSB
+    assert maxs.max() >= raw.max() - 2 * LSB
+    assert np.all(mins <= maxs)
+
+
+def test_columns_past_the_end_are_flat():
+    levels = build_peaks(samples(2))
+    mins, maxs = peak_columns(levels, 0.0, 4.0, 100)
+    assert np.all(mins[50:] == 0.0) and np.all(maxs[50:] == 0.0)
+    assert np.any(maxs[:50] > 0.0)
@@ -0,0 +1,152 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("PIL")
+
+from podcast_clean_ui import (PRIORITY_URGENT, Cancelled, Job, Pipeline)
+
+
+class Recorder:
+    """Thread-safe log of (event, job name) pairs."""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event, job):
+        with self._lock:
+            self.events.append((event, job.name))
+
+    def index(self, event, name):
+        return self.events.index((event, name))
+
+    def count(self, event, name):
+        return self.events.count((event, name))
+
+
+def run_in_thread(pipeline, jobs):
+    result = {}
+    t = threading.Thread(target=lambda: result.update(util=pipeline.run(jobs)), daemon=True)
+    t.start()
+    return t, result
+
+
+def busy(job, seconds, started=None):
+    """Stand-in for a long stage: calls check() until done or stopped."""
+    if started:
+        started.set()
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        job.check()
+        time.sleep(0.005)
+
+
+def test_runs_every_job_through_every_stage_and_isolates_errors():
+    log = Recorder()
+    errors = []
+
+    def decode(job):
+        log("decode", job)
+
+    def transcribe(job):
+        if job.name == "bad":
+            raise ValueError("broken file")
+        log("transcribe", job)
+
+    def render(job):
+        log("render", job)
+
+    pipeline = Pipeline([("decode", decode, 1), ("transcribe", transcribe, 1),
+                         ("render", render, 2)],
+                        on_error=lambda job, stage, e: errors.append((job.name, stage)))
+    jobs = [Job(name, name) for name in ("a", "bad", "c")]
+    util = pipeline.run(jobs)
+
+    assert errors == [("bad", "transcribe")]
+    assert isinstance(jobs[1].error, ValueError)
+    for name in ("a", "c"):
+        assert log.index("decode", name) < log.index("transcribe", name) < log.index("render", name)
+    assert ("render", "bad") not in log.events
+    assert set(util) == {"decode", "transcribe", "render"}
+
+
+def test_urgent_job_preempts_and_others_resume():
+    log = Recorder()
+    started = threading.Event()
+    preempted = []
+
+    def decode(job):
+        log("decode", job)
+
+    def transcribe(job):
+        log("transcribe", job)
+        busy(job, 0.05 if job.priority == PRIORITY_URGENT else 0.3, started)
+        log("transcribed", job)
+
+    pipeline = Pipeline([("decode", decode, 1), ("transcribe", transcribe, 1),
+                         ("render", lambda job: log("render", job), 1)],
+                        preempt_through="transcribe",
+                        on_preempt=lambda job, stage: preempted.append((job.name, stage)))
+    t, _ = run_in_thread(pipeline, [Job("low1", "low1"), Job("low2", "low2")])
+    assert started.wait(5)
+    urgent = Job("urgent", "urgent", PRIORITY_URGENT)
+    assert pipeline.submit(urgent)
+    t.join(10)
+    assert not t.is_alive()
+
+    assert ("low1", "transcribe") in preempted
+    done = [name for event, name in log.events if event == "transcribed"]
+    assert done[0] == "urgent"
+    assert sorted(done) == ["low1", "low2", "urgent"]
+    # A preempted job starts over from the first stage once the urgent one is through.
+    assert log.count("decode", "low1") == 2
+    second_decode = [i for i, e in enumerate(log.events) if e == ("decode", "low1")][1]
+    assert second_decode > log.index("transcribed", "urgent")
+    assert urgent.error is None
+
+
+def test_check_is_safe_while_jobs_come_and_go():
+    errors = []
+
+    def transcribe(job):
+        for _ in range(2000):
+            job.check()
+
+    for _ in range(3):
+        pipeline = Pipeline([("decode", lambda job: None, 1), ("transcribe", transcribe, 2),
+                             ("render", lambda job: None, 2)],
+                            preempt_through="transcribe",
+                            on_error=lambda job, stage, e: errors.append(repr(e)))
+        t, _ = run_in_thread(pipeline, [Job(f"a{n}", "out") for n in range(30)])
+        for n in range(30):
+            pipeline.submit(Job(f"b{n}", "out", PRIORITY_URGENT if n % 2 else 1))
+            time.sleep(0.001)
+        t.join(30)
+        assert not t.is_alive()
+    assert errors == []
+
+
+def test_cancel_stops_running_and_queued_jobs_and_refuses_new_ones():
+    started = threading.Event()
+    errors = []
+
+    pipeline = Pipeline([("decode", lambda job: None, 1),
+                         ("transcribe", lambda job: busy(job, 30, started), 1),
+                         ("render", lambda job: None, 1)],
+                        on_error=lambda job, stage, e: errors.append(job.name))
+    jobs = [Job(name, name) for name in ("a", "b", "c")]
+    t, result = run_in_thread(pipeline, jobs)
+    assert started.wait(5)
+    t0 = time.monotonic()
+    pipeline.cancel()
+    t.join(10)
+
+    assert not t.is_alive()
+    assert time.monotonic() - t0 < 5
+    assert all(isinstance(job.error, Cancelled) for job in jobs)
+    assert sorted(errors) == ["a", "b", "c"]
+    assert not pipeline.submit(Job("late", "late"))
+    assert "util" in result
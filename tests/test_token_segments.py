@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("PIL")
+
+from podcast_clean_ui import _token_segments
+
+
+class FakeTokenizer:
+    """Text tokens are < eot; timestamp tokens count 20 ms from timestamp_begin."""
+
+    eot = 100
+    timestamp_begin = 200
+
+    def decode(self, tokens):
+        return "".join(f" w{tok}" for tok in tokens)
+
+
+def ts(seconds):
+    return FakeTokenizer.timestamp_begin + round(seconds / 0.02)
+
+
+def test_single_timestamp_ending_consumes_window():
+    tokens = [ts(0.0), 1, 2, ts(5.0), ts(5.0), 3, ts(8.0)]
+    segments, resume_at = _token_segments(tokens, FakeTokenizer(), 29.0)
+    assert [(s["start"], s["end"]) for s in segments] == [(0.0, 5.0), (5.0, 8.0)]
+    assert resume_at is None
+
+
+def test_paired_timestamp_ending_resumes_at_last_pair():
+    tokens = [ts(0.0), 1, 2, ts(5.0), ts(5.0), 3, ts(8.0), ts(8.0)]
+    segments, resume_at = _token_segments(tokens, FakeTokenizer(), 29.0)
+    assert [(s["start"], s["end"]) for s in segments] == [(0.0, 5.0), (5.0, 8.0)]
+    assert resume_at == pytest.approx(8.0)
+
+
+def test_text_after_last_pair_is_decoded_again():
+    tokens = [ts(0.0), 1, ts(5.0), ts(5.0), 2, 3]
+    segments, resume_at = _token_segments(tokens, FakeTokenizer(), 29.0)
+    assert [s["text"] for s in segments] == [" w1"]
+    assert resume_at == pytest.approx(5.0)
+
+
+def test_no_timestamp_pairs_consumes_window():
+    tokens = [ts(0.0), 1, 2, 3]
+    segments, resume_at = _token_segments(tokens, FakeTokenizer(), 12.5)
+    assert [(s["start"], s["end"]) for s in segments] == [(0.0, 12.5)]
+    assert resume_at is None